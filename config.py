@@ -9,6 +9,10 @@ MESSAGE_BOOKMARK_NOT_FOUND = ":question: No bookmarks found for search term `{na
 MESSAGE_BOOKMARK_SUCCESS = ':white_check_mark: Bookmarked message {message_id} with name "{name}".'
 MESSAGE_BOOKMARK_EXISTS = 'A bookmark with the name "{name}" already exists.'
 
+## Hashes of the last synced command tree per application, used to skip redundant syncs on startup
+## Set the FORCE_COMMAND_SYNC environment variable to sync regardless
+COMMAND_TREE_HASH_FILE = ".command_tree_hash"
+
 ## This is what the bot will report as
 USER_AGENT="PasteBot/2.0"
 
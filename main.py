@@ -1,7 +1,11 @@
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
+import asyncio
+import hashlib
+import json
 import os
+import time
 
 from config import *
 load_dotenv()
@@ -12,26 +16,74 @@ intents.message_content = True
 bot = commands.Bot(command_prefix=PREFIX, intents=intents)
 
 loaded_cogs = []
+start_time = None
+
+def command_tree_hash():
+    # Hash the payload Discord would receive so any change to a command forces a sync
+    payload = [command.to_dict(bot.tree) for command in bot.tree.get_commands()]
+    payload.sort(key=lambda command: (command.get("type", 1), command["name"]))
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+async def sync_command_tree():
+    # Hashes are stored per application so switching bot tokens always syncs
+    application_id = str(bot.application_id)
+    tree_hash = command_tree_hash()
+    try:
+        with open(COMMAND_TREE_HASH_FILE, "r") as f:
+            synced_hashes = json.load(f)
+    except (OSError, ValueError):
+        synced_hashes = {}
+    if not isinstance(synced_hashes, dict):
+        synced_hashes = {}
+
+    if os.environ.get("FORCE_COMMAND_SYNC"):
+        print("FORCE_COMMAND_SYNC is set, syncing command tree")
+    elif synced_hashes.get(application_id) == tree_hash:
+        print("Command tree unchanged, skipping sync")
+        return
+    else:
+        print("Command tree changed, syncing")
+
+    await bot.tree.sync()
+    synced_hashes[application_id] = tree_hash
+    with open(COMMAND_TREE_HASH_FILE, "w") as f:
+        json.dump(synced_hashes, f)
 
 @bot.event
 async def on_ready():
+    global start_time
     print(f"We have logged in as {bot.user}")
-    await bot.tree.sync()
+    await sync_command_tree()
+    if start_time is not None:
+        print(f"Ready in {time.perf_counter() - start_time:.2f}s")
+        # Only report the initial startup, not reconnects
+        start_time = None
 
-async def main():
-    global loaded_cogs
-    async with bot:
-        for filename in os.listdir(os.path.join(os.path.dirname(__file__), "cogs")):
-            if filename.endswith(".py"):
-                module = f"cogs.{filename[:-3]}"
-                print(f"Loading module {module}")
-                try:
-                    await bot.load_extension(module)
-                    loaded_cogs.append(module)
+async def load_cog(module):
+    print(f"Loading module {module}")
+    await bot.load_extension(module)
+    return module
 
-                except Exception as e:
-                    print(f"Failed to load module {module}: {e}")
+async def load_cogs():
+    modules = [
+        f"cogs.{filename[:-3]}"
+        for filename in sorted(os.listdir(os.path.join(os.path.dirname(__file__), "cogs")))
+        if filename.endswith(".py")
+    ]
+    results = await asyncio.gather(*(load_cog(module) for module in modules), return_exceptions=True)
+    for module, result in zip(modules, results):
+        if isinstance(result, BaseException):
+            print(f"Failed to load module {module}: {result}")
+        else:
+            loaded_cogs.append(module)
 
+async def main():
+    global start_time
+    start_time = time.perf_counter()
+    async with bot:
+        await load_cogs()
+        print(f"Loaded {len(loaded_cogs)} module(s) in {time.perf_counter() - start_time:.2f}s")
         await bot.start(os.environ["DISCORD_TOKEN"])
 
 async def close_cogs():
@@ -41,7 +93,6 @@ async def close_cogs():
     await bot.close()
 
 if __name__ == "__main__":
-    import asyncio
     try:
         asyncio.run(main())
     except KeyboardInterrupt: